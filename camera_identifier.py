@@ -1,11 +1,39 @@
 import cv2
 import os
 import subprocess
+import threading
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import platform
+import time
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from utils.logger_util.logger import get_logger
+from .webcam import _default_backend
+
+# Number of OpenCV device IDs probed on platforms without a device listing
+MAX_PROBED_DEVICES = 10
+# Seconds a get_all_cameras scan is reused before devices are reopened
+CAMERA_CACHE_TTL = 5.0
+# "E: KEY=value" property lines of a `udevadm info --export-db` record
+_UDEV_PROPERTY_RE = re.compile(r'^E: ([^=\n]+)=(.*)$', re.M)
+
+
+@contextmanager
+def _open_capture(device_id: int):
+    """Open a VideoCapture that is released as soon as the block exits."""
+    # Same backend as Webcam: backends can number devices differently (e.g. MSMF
+    # vs DirectShow), so probing with another one could report other devices
+    cap = cv2.VideoCapture(device_id, _default_backend())
+    try:
+        yield cap
+    finally:
+        cap.release()
+
 
 class CameraIdentifier(ABC):
     """
@@ -16,18 +44,34 @@ class CameraIdentifier(ABC):
     def __init__(self):
         self.system = platform.system().lower()
         self.logger = get_logger("CameraIdentifier")
+        # (timestamp, cameras, unique_signature -> device_id) of the last full scan,
+        # reused for _cache_ttl seconds. Replaced as a whole and read into a local
+        # once, since the udev monitor thread may invalidate it at any moment.
+        self._cache: Optional[Tuple[float, Dict[str, Dict[str, str]], Dict[str, int]]] = None
+        self._cache_ttl = CAMERA_CACHE_TTL
         
-    def get_camera_info(self, device_id: int, cap: cv2.VideoCapture) -> Dict[str, str]:
+    def get_camera_info(self, device_id: int, cap: Optional[cv2.VideoCapture] = None) -> Optional[Dict[str, str]]:
         """
         Get comprehensive camera information for identification.
         
         Args:
             device_id: OpenCV device ID
-            cap: OpenCV VideoCapture object
+            cap: Already open VideoCapture for this device; it is left open.
+                When omitted the device is opened and released here.
             
         Returns:
-            Dictionary with camera identification information
+            Dictionary with camera identification information, or None if the
+            device could not be opened
         """
+        with _open_capture(device_id) if cap is None else nullcontext(cap) as cap:
+            if not cap.isOpened():
+                return None
+            
+            # Create a resolution signature
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = int(cap.get(cv2.CAP_PROP_FPS))
+        
         info = {
             'device_id': str(device_id),
             'hardware_id': '',
@@ -36,38 +80,42 @@ class CameraIdentifier(ABC):
             'serial_number': '',
             'device_path': '',
             'name': '',
-            'resolution_signature': '',
+            'resolution_signature': f"{width}x{height}@{fps}",
             'unique_signature': ''
         }
         
-        if cap.isOpened():
-            # Create a resolution signature
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = int(cap.get(cv2.CAP_PROP_FPS))
-            info['resolution_signature'] = f"{width}x{height}@{fps}"
-            cap.release()
-        
         # Platform-specific hardware identification
         self._get_platform_camera_info(device_id, info)
             
-        # Create a unique signature combining available identifiers
-        signature_parts = [
-            info.get('vendor_id', ''),
-            info.get('product_id', ''),
-            info.get('serial_number', ''),
-            info.get('resolution_signature', ''),
-            info.get('name', '').replace(' ', '_')
-        ]
-        info['unique_signature'] = '_'.join([part for part in signature_parts if part])
+        info['unique_signature'] = self._build_signature(info)
         
         return info
     
+    @staticmethod
+    def _build_signature(info: Dict[str, str]) -> str:
+        """Create a unique signature combining available identifiers."""
+        signature_parts = (
+            info['vendor_id'],
+            info['product_id'],
+            info['serial_number'],
+            info['resolution_signature'],
+            info['name'].replace(' ', '_')
+        )
+        return '_'.join(part for part in signature_parts if part)
+    
     @abstractmethod
     def _get_platform_camera_info(self, device_id: int, info: Dict[str, str]):
         """Platform-specific camera information retrieval."""
         pass
     
+    def _prefetch_platform_info(self):
+        """Hook to load metadata for all devices in one go ahead of a scan."""
+        pass
+    
+    def close(self):
+        """Stop any background helpers; lookups keep working afterwards."""
+        pass
+    
     @abstractmethod
     def get_available_video_devices(self) -> List[int]:
         """Get a list of all available video device IDs."""
@@ -77,28 +125,75 @@ class CameraIdentifier(ABC):
         """
         Scan for all available cameras and return their identification info.
         
+        Results are cached for ``_cache_ttl`` seconds; call ``invalidate_cache``
+        after a hot-plug event to force a rescan.
+        
         Returns:
             Dictionary mapping unique signatures to camera info
         """
+        return self._cached_scan()[1]
+    
+    def _cached_scan(self) -> Tuple[float, Dict[str, Dict[str, str]], Dict[str, int]]:
+        """The cached scan entry, rescanning once it has expired or been invalidated."""
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < self._cache_ttl:
+            return cache
+        
+        # Expired: also drop any platform data gathered for the previous scan
+        self.invalidate_cache()
+        cameras = self._scan_all_cameras()
+        sig_index = {
+            info['unique_signature']: int(info['device_id'])
+            for info in cameras.values()
+            if info['unique_signature']
+        }
+        cache = self._cache = (time.monotonic(), cameras, sig_index)
+        return cache
+    
+    def invalidate_cache(self):
+        """Drop cached scan results so the next lookup reopens every device."""
+        self._cache = None
+    
+    def _scan_all_cameras(self) -> Dict[str, Dict[str, str]]:
+        """Open every available device and collect its identification info."""
         cameras = {}
         
+        # Gather platform metadata once, before the per-device workers read it
+        self._prefetch_platform_info()
+        
         # Get available video devices first
         available_devices = self.get_available_video_devices()
         self.logger.info(f"Found video devices: {available_devices}")
+        if not available_devices:
+            return cameras
         
-        # Test each available device
-        for device_id in available_devices:
-            cap = cv2.VideoCapture(device_id)
-            if cap.isOpened():
-                info = self.get_camera_info(device_id, cap)
-                cap.release()
-                
-                # Use unique signature as key, fallback to device_id
-                key = info['unique_signature'] if info['unique_signature'] else f"device_{device_id}"
-                cameras[key] = info
+        # Test each available device concurrently; opening a capture blocks in
+        # driver code (GIL released), so the opens overlap instead of adding up.
+        # get_camera_info performs the only open per device.
+        with ThreadPoolExecutor(max_workers=len(available_devices)) as executor:
+            results = list(executor.map(self.get_camera_info, available_devices))
+        
+        for device_id, info in zip(available_devices, results):
+            if info is None:
+                continue
+            # Use unique signature as key, fallback to device_id
+            key = info['unique_signature'] if info['unique_signature'] else f"device_{device_id}"
+            cameras[key] = info
                 
         return cameras
     
+    @staticmethod
+    def _probe_device(device_id: int) -> Optional[int]:
+        """Return device_id if OpenCV can open it, None otherwise."""
+        with _open_capture(device_id) as cap:
+            return device_id if cap.isOpened() else None
+    
+    def _probe_opencv_devices(self) -> List[int]:
+        """Probe OpenCV device IDs concurrently, keeping every ID that opens (gaps included)."""
+        with ThreadPoolExecutor(max_workers=MAX_PROBED_DEVICES) as executor:
+            results = executor.map(self._probe_device, range(MAX_PROBED_DEVICES))
+        return [device_id for device_id in results if device_id is not None]
+    
     def find_camera_by_signature(self, target_signature: str) -> Optional[int]:
         """
         Find a camera by its unique signature and return the current device ID.
@@ -109,108 +204,250 @@ class CameraIdentifier(ABC):
         Returns:
             Current device ID if found, None otherwise
         """
-        cameras = self.get_all_cameras()
-        for signature, info in cameras.items():
-            if signature == target_signature:
-                return int(info['device_id'])
-        return None
+        # Refreshes the scan (and the signature index) once the cache has expired
+        return self._cached_scan()[2].get(target_signature)
 
 
 class LinuxCameraIdentifier(CameraIdentifier):
     """Linux-specific camera identification using v4l2 and udev."""
     
-    def _get_platform_camera_info(self, device_id: int, info: Dict[str, str]):
-        """Get camera info on Linux using v4l2 and udev."""
+    def __init__(self):
+        super().__init__()
+        # udev properties of every video4linux device, keyed by device node. Seeded from
+        # `udevadm info --export-db` and kept current by a `udevadm monitor` thread.
+        self._udev_devices: Optional[Dict[str, Dict[str, str]]] = None
+        self._udev_lock = threading.Lock()
+        self._monitor: Optional[subprocess.Popen] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        # Terminates the monitor at interpreter exit if close() was never called
+        self._monitor_finalizer: Optional[weakref.finalize] = None
+        # Card names from one `v4l2-ctl --list-devices`, keyed by device node
+        self._card_names: Optional[Dict[str, str]] = None
+    
+    def invalidate_cache(self):
+        """Drop cached scan results along with the parsed udev/v4l2 listings."""
+        super().invalidate_cache()
+        self._card_names = None
+        with self._udev_lock:
+            # A monitored table is live; only a one-shot snapshot goes stale
+            if self._monitor is None:
+                self._udev_devices = None
+    
+    def close(self):
+        """Stop the udev monitor; the next lookup starts a fresh one."""
+        with self._udev_lock:
+            finalizer, thread = self._monitor_finalizer, self._monitor_thread
+            self._monitor = None
+            self._monitor_thread = None
+            self._monitor_finalizer = None
+            self._udev_devices = None
+        if finalizer is not None:
+            finalizer()
+        if thread is not None:
+            thread.join(timeout=5)
+    
+    @staticmethod
+    def _terminate_monitor(monitor: subprocess.Popen):
         try:
-            # Map OpenCV device ID to video device
-            video_device = f"/dev/video{device_id}"
-            
-            # Get device info using v4l2-ctl if available
+            monitor.terminate()
             try:
-                result = subprocess.run(['v4l2-ctl', '--device', video_device, '--info'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'Card type' in line:
-                            info['name'] = line.split(':')[1].strip()
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-            
-            # Get hardware info using udevadm
+                monitor.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                monitor.kill()
+        except Exception:
+            # Already gone, or the interpreter is shutting down
+            pass
+    
+    def _prefetch_platform_info(self):
+        """Run udevadm and v4l2-ctl once for every device ahead of a scan."""
+        self._udev_db()
+        self._v4l2_card_names()
+    
+    def _udev_db(self) -> Dict[str, Dict[str, str]]:
+        """Get udev properties of all video4linux devices, keyed by device node."""
+        with self._udev_lock:
+            if self._udev_devices is None:
+                # Subscribe before seeding so no hot-plug event falls in between
+                self._start_monitor()
+                self._udev_devices = self._read_udev_db()
+            return dict(self._udev_devices)
+    
+    def _read_udev_db(self) -> Dict[str, Dict[str, str]]:
+        """Parse `udevadm info --export-db` into video4linux device properties."""
+        devices = {}
+        try:
+            result = subprocess.run(['udevadm', 'info', '--export-db'], 
+                                  capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                # One blank-line separated record per device, properties as "E: KEY=value"
+                for record in result.stdout.split('\n\n'):
+                    props = dict(_UDEV_PROPERTY_RE.findall(record))
+                    if props.get('SUBSYSTEM') == 'video4linux' and 'DEVNAME' in props:
+                        devices[props['DEVNAME']] = props
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+        return devices
+    
+    def _start_monitor(self):
+        """Spawn `udevadm monitor` and a thread applying its events to the device table."""
+        try:
+            self._monitor = subprocess.Popen(
+                ['udevadm', 'monitor', '--udev', '--subsystem-match=video4linux', '--property'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        except (FileNotFoundError, OSError) as e:
+            self.logger.debug(f"udev monitor unavailable, falling back to polling: {e}")
+            self._monitor = None
+            return
+        self._monitor_finalizer = weakref.finalize(self, LinuxCameraIdentifier._terminate_monitor, self._monitor)
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop, args=(self._monitor,), name="udev-monitor", daemon=True)
+        self._monitor_thread.start()
+    
+    def _monitor_loop(self, monitor: subprocess.Popen):
+        """Apply add/change/remove events from the monitor until it exits."""
+        props: Dict[str, str] = {}
+        for line in monitor.stdout:
+            line = line.strip()
+            if line:
+                # Event header and banner lines carry no "=", only properties do
+                key, sep, value = line.partition('=')
+                if sep:
+                    props[key] = value
+                continue
+            # Blank line ends an event record
+            event, props = props, {}
+            action, devname = event.get('ACTION'), event.get('DEVNAME')
+            if not action or not devname:
+                continue
+            with self._udev_lock:
+                if self._monitor is not monitor or self._udev_devices is None:
+                    continue
+                if action == 'remove':
+                    self._udev_devices.pop(devname, None)
+                else:
+                    self._udev_devices[devname] = event
+            # Hot-plug: the next scan must reopen devices and re-read card names
+            self.logger.info(f"Video device {action}: {devname}")
+            CameraIdentifier.invalidate_cache(self)
+            self._card_names = None
+        
+        with self._udev_lock:
+            # Monitor exited on its own: keep the table as a snapshot that the next
+            # invalidate_cache drops, which also re-spawns the monitor
+            if self._monitor is monitor:
+                self._monitor = None
+                self._monitor_thread = None
+                if self._monitor_finalizer is not None:
+                    self._monitor_finalizer.detach()
+                    self._monitor_finalizer = None
+    
+    def _v4l2_card_names(self) -> Dict[str, str]:
+        """Get the card name of every video device, keyed by device node."""
+        # Local copy: the udev monitor thread may reset _card_names meanwhile
+        names = self._card_names
+        if names is None:
+            names = {}
             try:
-                result = subprocess.run(['udevadm', 'info', '--name', video_device], 
+                result = subprocess.run(['v4l2-ctl', '--list-devices'], 
                                       capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'ID_VENDOR_ID=' in line:
-                            info['vendor_id'] = line.split('=')[1].strip()
-                        elif 'ID_MODEL_ID=' in line:
-                            info['product_id'] = line.split('=')[1].strip()
-                        elif 'ID_SERIAL_SHORT=' in line:
-                            info['serial_number'] = line.split('=')[1].strip()
-                        elif 'DEVPATH=' in line:
-                            info['device_path'] = line.split('=')[1].strip()
+                # Output lists "Card name (bus info):" followed by indented device nodes.
+                # A non-zero exit only means some node failed, so parse what was printed.
+                card_name = ''
+                for line in result.stdout.split('\n'):
+                    if not line.strip():
+                        continue
+                    if line[0].isspace():
+                        if card_name:
+                            names[line.strip()] = card_name
+                    else:
+                        header = line.rstrip().rstrip(':')
+                        card_name = header.rpartition(' (')[0] or header
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 pass
+            self._card_names = names
+        return names
+    
+    def _get_platform_camera_info(self, device_id: int, info: Dict[str, str]):
+        """Get camera info on Linux from the parsed v4l2 and udev listings."""
+        try:
+            # Map OpenCV device ID to video device
+            video_device = f"/dev/video{device_id}"
+            
+            card_name = self._v4l2_card_names().get(video_device)
+            if card_name:
+                info['name'] = card_name
+            
+            props = self._udev_db().get(video_device, {})
+            info['vendor_id'] = props.get('ID_VENDOR_ID', '')
+            info['product_id'] = props.get('ID_MODEL_ID', '')
+            info['serial_number'] = props.get('ID_SERIAL_SHORT', '')
+            info['device_path'] = props.get('DEVPATH', '')
                 
         except Exception as e:
             self.logger.error(f"Error getting Linux camera info: {e}")
     
     def get_available_video_devices(self) -> List[int]:
         """Get a list of all available /dev/video[x] device IDs."""
-        available_devices = []
+        # Prefer the udev listing; fall back to scanning /dev when udev is unavailable
+        video_devices = [os.path.basename(device_path) for device_path in self._udev_db()]
+        if not video_devices:
+            with os.scandir('/dev') as entries:
+                video_devices = [entry.name for entry in entries if entry.name.startswith('video')]
         
-        # Check /dev/video* devices
-        import glob
-        video_devices = glob.glob('/dev/video*')
-        for device_path in video_devices:
-            try:
-                # Extract device number from /dev/video[x]
-                device_num = int(device_path.replace('/dev/video', ''))
-                available_devices.append(device_num)
-            except ValueError:
-                continue
-        
-        return sorted(available_devices)
+        # Extract device number from video[x]
+        # udev lists every video4linux node (radioN, vbiN, ...); only videoN are capture IDs
+        return sorted(int(name[5:]) for name in video_devices
+                      if name.startswith('video') and name[5:].isdigit())
 
 
 class MacOSCameraIdentifier(CameraIdentifier):
     """macOS-specific camera identification using system_profiler."""
     
+    def __init__(self):
+        super().__init__()
+        # Camera entries from one `system_profiler SPCameraDataType` call
+        self._profiler_cameras: Optional[List[Dict[str, str]]] = None
+    
+    def invalidate_cache(self):
+        """Drop cached scan results along with the system_profiler listing."""
+        super().invalidate_cache()
+        self._profiler_cameras = None
+    
+    def _prefetch_platform_info(self):
+        """Run system_profiler once for every device ahead of a scan."""
+        self._system_profiler_cameras()
+    
+    def _system_profiler_cameras(self) -> List[Dict[str, str]]:
+        """Get the camera list reported by system_profiler, in device order."""
+        cameras = self._profiler_cameras
+        if cameras is None:
+            cameras = []
+            try:
+                result = subprocess.run(['system_profiler', 'SPCameraDataType', '-json'], 
+                                      capture_output=True, text=True, timeout=10)
+                if result.returncode == 0:
+                    cameras = json.loads(result.stdout).get('SPCameraDataType', [])
+            except Exception as e:
+                self.logger.error(f"Error getting macOS camera info: {e}")
+            self._profiler_cameras = cameras
+        return cameras
+    
     def _get_platform_camera_info(self, device_id: int, info: Dict[str, str]):
-        """Get camera info on macOS using system_profiler."""
-        try:
-            result = subprocess.run(['system_profiler', 'SPCameraDataType', '-json'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                cameras = data.get('SPCameraDataType', [])
-                
-                # Try to match by index (not perfect but better than nothing)
-                if device_id < len(cameras):
-                    camera = cameras[device_id]
-                    info['name'] = camera.get('_name', '')
-                    info['vendor_id'] = camera.get('vendor_id', '')
-                    info['product_id'] = camera.get('product_id', '')
-                    info['serial_number'] = camera.get('serial_num', '')
-                    
-        except Exception as e:
-            self.logger.error(f"Error getting macOS camera info: {e}")
+        """Get camera info on macOS from the system_profiler listing."""
+        cameras = self._system_profiler_cameras()
+        
+        # Try to match by index (not perfect but better than nothing)
+        if device_id < len(cameras):
+            camera = cameras[device_id]
+            info['name'] = camera.get('_name', '')
+            info['vendor_id'] = camera.get('vendor_id', '')
+            info['product_id'] = camera.get('product_id', '')
+            info['serial_number'] = camera.get('serial_num', '')
     
     def get_available_video_devices(self) -> List[int]:
         """Get available video devices by testing OpenCV device IDs."""
-        available_devices = []
-        
         # For macOS, test OpenCV device IDs
-        for device_id in range(10):
-            cap = cv2.VideoCapture(device_id)
-            if cap.isOpened():
-                available_devices.append(device_id)
-                cap.release()
-            else:
-                break
-        
-        return available_devices
+        return self._probe_opencv_devices()
 
 
 class WindowsCameraIdentifier(CameraIdentifier):
@@ -234,24 +471,18 @@ class WindowsCameraIdentifier(CameraIdentifier):
     
     def get_available_video_devices(self) -> List[int]:
         """Get available video devices by testing OpenCV device IDs."""
-        available_devices = []
-        
         # For Windows, test OpenCV device IDs
-        for device_id in range(10):
-            cap = cv2.VideoCapture(device_id)
-            if cap.isOpened():
-                available_devices.append(device_id)
-                cap.release()
-            else:
-                break
-        
-        return available_devices
+        return self._probe_opencv_devices()
 
 
+@lru_cache(maxsize=1)
 def create_camera_identifier() -> CameraIdentifier:
     """
     Factory function to create the appropriate CameraIdentifier for the current platform.
     
+    The instance is created once and shared, so its scan cache, signature index
+    and (on Linux) udev monitor are reused by every caller.
+    
     Returns:
         Platform-specific CameraIdentifier instance
     """
@@ -5,6 +5,9 @@ from plugins.cv2_visualization_plugin.gui_component import GuiComponent
 
 class GUIFrames(GuiComponent):
     """A component to display a video frame with optional camera name label."""
+    BANNER_HEIGHT = 31  # Rows darkened under the camera name (0-30, like the inclusive cv2.rectangle)
+    BANNER_ALPHA = 0.3  # Fraction of the frame brightness kept under the strip
+
     def __init__(
         self, 
         name: str, 
@@ -18,27 +21,37 @@ class GUIFrames(GuiComponent):
         super().__init__(name, width, height, parent, position)
         self.show_camera_name = show_camera_name
         self.camera_name = name  # Store the camera name for display
+        self._banner: Optional[np.ndarray] = None  # Pre-rendered name text, built on first use
 
     def set_frame(self, frame: np.ndarray):
         """Sets the video frame and scales it to fit the component dimensions."""
-        # Scale frame to fit the component's width and height
-        scaled_frame = cv2.resize(frame, (self.width, self.height))
-        self.canvas = scaled_frame.copy()  # Copy to avoid modifying original
+        canvas = self._ensure_canvas()
+        if frame.shape == canvas.shape:
+            # Already the right size: a plain copy is far cheaper than a resize pass
+            np.copyto(canvas, frame)
+        else:
+            # Scale frame to fit the component's width and height, writing into the
+            # reused canvas buffer instead of allocating a new array per frame
+            self.canvas = cv2.resize(frame, (self.width, self.height), dst=canvas,
+                                     interpolation=cv2.INTER_LINEAR)
         
         # Add camera name overlay if enabled
         if self.show_camera_name:
             self._add_camera_name_overlay()
 
-    def _add_camera_name_overlay(self):
-        """Add camera name text overlay to the frame."""
-        if self.canvas is not None:
-            # Add semi-transparent background for text
-            overlay = self.canvas.copy()
-            text_height = 30
-            cv2.rectangle(overlay, (0, 0), (self.width, text_height), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.7, self.canvas, 0.3, 0, self.canvas)
+    def _ensure_canvas(self) -> np.ndarray:
+        """Return the canvas buffer, (re)allocating it only when the component size changes."""
+        canvas_shape = (self.height, self.width, 3)
+        if self.canvas is None or self.canvas.shape != canvas_shape:
+            self.canvas = np.zeros(canvas_shape, dtype=np.uint8)
+        return self.canvas
+
+    def _get_banner(self) -> np.ndarray:
+        """Return the camera name rendered white on black, rebuilt only when the size changes."""
+        banner_shape = (min(self.BANNER_HEIGHT, self.height), self.width, 3)
+        if self._banner is None or self._banner.shape != banner_shape:
+            banner = np.zeros(banner_shape, dtype=np.uint8)
             
-            # Add camera name text
             font = cv2.FONT_HERSHEY_SIMPLEX
             font_scale = 0.7
             font_color = (255, 255, 255)  # White text
@@ -49,10 +62,21 @@ class GUIFrames(GuiComponent):
             text_x = (self.width - text_size[0]) // 2
             text_y = 20
             
-            cv2.putText(self.canvas, self.camera_name, (text_x, text_y), 
+            cv2.putText(banner, self.camera_name, (text_x, text_y), 
                        font, font_scale, font_color, thickness)
+            self._banner = banner
+        return self._banner
+
+    def _add_camera_name_overlay(self):
+        """Add camera name text overlay to the frame."""
+        if self.canvas is not None:
+            banner = self._get_banner()
+            strip = self.canvas[:banner.shape[0]]
+            # Darken the strip in place in one pass (same result as blending a black box
+            # at 0.7), then add the pre-rendered text; saturation keeps text pure white
+            cv2.convertScaleAbs(strip, dst=strip, alpha=self.BANNER_ALPHA, beta=0)
+            cv2.add(strip, banner, dst=strip)
 
     def draw(self):
         """Draws the stored frame onto the surface at its absolute position."""
-        if self.canvas is None:
-            self.canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
\ No newline at end of file
+        self._ensure_canvas()
\ No newline at end of file
@@ -5,10 +5,14 @@ opening real hardware it produces frames from a static image path specified by e
 device's `no_cam_image_path`. If the path is missing or load fails, a blank frame is used.
 
 Frames are returned via a lightweight VirtualWebcam shim exposing get_frame()/release().
-Images are resized to requested width/height if necessary.
+Images are resized to requested width/height if necessary. The prepared frame is shared
+and read-only; callers that need to draw on it must copy it (or use get_frame_into()).
 """
 
-from typing import Dict, Optional, List
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
 import cv2
 import numpy as np
 
@@ -17,34 +21,69 @@ from utils.logger_util.logger import get_logger
 from .webcam_plugin import WebcamPlugin  # for structural similarity / potential reuse
 
 
+def _prepare_frame(img: np.ndarray, w: int, h: int, orientation: float) -> np.ndarray:
+    if img is None or img.size == 0:
+        return np.zeros((h, w, 3), dtype=np.uint8)
+    # Resize if different
+    if img.shape[0] != h or img.shape[1] != w:
+        img = cv2.resize(img, (w, h), interpolation=cv2.INTER_LINEAR)
+    # Basic orientation rotate (multiples of 90, clockwise; np.rot90 turns counter-clockwise)
+    k = (int(orientation) % 360) // 90
+    if k:
+        # rot90 is a strided view; materialize it once here since the frame is static
+        # and every consumer (cv2.resize, np.copyto, ...) would otherwise copy it per call
+        img = np.ascontiguousarray(np.rot90(img, -k))
+    return img
+
+
+def _prepared_frame(img: Optional[np.ndarray], w: int, h: int, orientation: float) -> np.ndarray:
+    """Resized/rotated read-only frame for a decoded image (blank when img is None)."""
+    if img is None:
+        # Rotate the blank like an image, so 90/270 devices get the same (w, h) shape
+        img = np.zeros((h, w, 3), dtype=np.uint8)
+    frame = _prepare_frame(img, w, h, orientation)
+    frame.flags.writeable = False
+    return frame
+
+
 class VirtualWebcam:
-    def __init__(self, name: str, source_img: np.ndarray, width: int, height: int, orientation: float = 0.0):
+    def __init__(self, name: str, frame: np.ndarray, width: int, height: int, orientation: float = 0.0):
+        """Wrap an already prepared (resized and rotated) frame; it is shared, never copied."""
         self.name = name
-        self._frame = self._prepare_frame(source_img, width, height, orientation)
+        self._frame = frame
+        # The frame never changes, so hand out the same buffer instead of copying per call
+        self._frame.flags.writeable = False
         self.is_opened = True
         self.device_id = -1
         self.width = width
         self.height = height
         self.orientation = orientation
 
-    def _prepare_frame(self, img: np.ndarray, w: int, h: int, orientation: float) -> np.ndarray:
-        if img is None or img.size == 0:
-            return np.zeros((h, w, 3), dtype=np.uint8)
-        # Resize if different
-        if img.shape[0] != h or img.shape[1] != w:
-            img = cv2.resize(img, (w, h), interpolation=cv2.INTER_LINEAR)
-        # Basic orientation rotate (multiples of 90)
-        rot = int(orientation) % 360
-        if rot == 90:
-            img = cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
-        elif rot == 180:
-            img = cv2.rotate(img, cv2.ROTATE_180)
-        elif rot == 270:
-            img = cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        return img
+    # Signatures mirror Webcam so debug mode is a drop-in; the frame is static,
+    # already contiguous and never waits, so most options are no-ops here
+
+    def get_frame(self, contiguous: bool = False, wait: bool = False,
+                  timeout: Optional[float] = None, copy: bool = False) -> np.ndarray:
+        """Return the shared read-only frame; pass copy=True (or copy it) before modifying."""
+        return self._frame.copy() if copy else self._frame
 
-    def get_frame(self):
-        return self._frame.copy()
+    def get_frame_into(self, out: np.ndarray, wait: bool = False,
+                       timeout: Optional[float] = None) -> bool:
+        """Copy the frame into a caller-owned buffer of the same shape."""
+        np.copyto(out, self._frame)
+        return True
+
+    def grab(self) -> bool:
+        return self.is_opened
+
+    def retrieve(self, contiguous: bool = False) -> np.ndarray:
+        return self._frame
+
+    @property
+    def stats(self) -> dict:
+        """Same keys as Webcam.stats; nothing is ever captured."""
+        return {"grabbed": 0, "dropped": 0, "retrieves": 0, "retrieve_ns": 0,
+                "retrieve_ms_avg": 0.0, "last_frame_age_ms": None}
 
     def get_device_info(self):
         return {
@@ -65,33 +104,59 @@ class NoWebcamPlugin(WebcamPlugin):  # Inherit for API similarity; override init
         self.logger = get_logger("NoWebcamPlugin")
         self.config_manager = ConfigManager()
         self.cameras: Dict[str, VirtualWebcam] = {}
+        self._by_name: Dict[str, VirtualWebcam] = {}
         self._load_virtual_cameras()
 
     def _load_virtual_cameras(self):
         cfg = self.config_manager.config.webcam_plugin
         devices = (cfg.devices or []) if cfg else []
-        loaded = 0
-        for dev in devices:
-            name = getattr(dev, 'name', f'virt_{loaded}')
-            width = int(getattr(dev, 'width', 640) or 640)
-            height = int(getattr(dev, 'height', 480) or 480)
-            orientation = float(getattr(dev, 'orientation', 0.0) or 0.0)
-            img_path = getattr(dev, 'no_cam_image_path', None)
-            frame = None
-            if img_path:
-                try:
-                    frame = cv2.imread(img_path, cv2.IMREAD_COLOR)
-                    if frame is None:
-                        self.logger.warning(f"Failed to load image for {name}: {img_path}; using blank frame")
-                except Exception as e:
-                    self.logger.warning(f"Exception loading image {img_path} for {name}: {e}")
-            if frame is None:
-                frame = np.zeros((height, width, 3), dtype=np.uint8)
-            virt = VirtualWebcam(name=name, source_img=frame, width=width, height=height, orientation=orientation)
-            self.cameras[name] = virt
-            loaded += 1
-            self.logger.info(f"Virtual camera '{name}' loaded from {img_path or 'blank'}")
-        self.logger.info(f"Initialized {loaded} virtual cameras (debug mode)")
+        if devices:
+            specs = [self._device_spec(index, dev) for index, dev in enumerate(devices)]
+            # Decode each distinct image, then build each distinct (image, size,
+            # orientation) frame, exactly once: devices sharing a placeholder share
+            # one buffer. Decode/resize release the GIL, so each stage runs concurrently.
+            paths = list(dict.fromkeys(path for _, _, _, _, path in specs if path))
+            with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+                images = dict(zip(paths, executor.map(self._load_image, paths)))
+                keys = list(dict.fromkeys(
+                    (path if images.get(path) is not None else None, width, height, orientation)
+                    for _, width, height, orientation, path in specs))
+                prepared = executor.map(
+                    lambda key: _prepared_frame(images.get(key[0]), *key[1:]), keys)
+                frames = dict(zip(keys, prepared))
+            # Register here, in config order
+            for name, width, height, orientation, path in specs:
+                source = path if images.get(path) is not None else None
+                if path and source is None:
+                    self.logger.warning("Failed to load image for %s: %s; using blank frame", name, path)
+                frame = frames[(source, width, height, orientation)]
+                virt = VirtualWebcam(name=name, frame=frame, width=width, height=height, orientation=orientation)
+                self.cameras[name] = virt
+                self._by_name[name] = virt
+                self.logger.info("Virtual camera '%s' loaded from %s", name, path or 'blank')
+        self.logger.info("Initialized %d virtual cameras (debug mode)", len(devices))
+
+    @staticmethod
+    def _device_spec(index: int, dev) -> Tuple[str, int, int, float, Optional[str]]:
+        """(name, width, height, orientation, image path) of one device config entry."""
+        return (
+            getattr(dev, 'name', f'virt_{index}'),
+            int(getattr(dev, 'width', 640) or 640),
+            int(getattr(dev, 'height', 480) or 480),
+            float(getattr(dev, 'orientation', 0.0) or 0.0),
+            getattr(dev, 'no_cam_image_path', None),
+        )
+
+    def _load_image(self, path: str) -> Optional[np.ndarray]:
+        """Decode one image read-only; None if it can't be read (not cached, so fixing the file works)."""
+        try:
+            img = cv2.imread(path, cv2.IMREAD_COLOR)
+        except Exception as e:
+            self.logger.warning("Exception loading image %s: %s", path, e)
+            return None
+        if img is not None:
+            img.flags.writeable = False
+        return img
 
     # Override getters for clarity
     def get_all_cameras(self) -> Dict[str, VirtualWebcam]:
@@ -100,10 +165,16 @@ class NoWebcamPlugin(WebcamPlugin):  # Inherit for API similarity; override init
     def get_camera(self, camera_id: str):
         return self.cameras.get(camera_id)
 
+    def read_all_frames(self, contiguous: bool = False) -> Dict[str, np.ndarray]:
+        # Virtual frames are prepared up front (and always contiguous); nothing to grab
+        return {name: cam.get_frame() for name, cam in self.cameras.items() if cam.is_opened}
+
     def list_cameras(self):
-        self.logger.info(f"NoWebcamPlugin - Virtual Cameras ({len(self.cameras)}):")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("NoWebcamPlugin - Virtual Cameras (%d):", len(self.cameras))
         for name, cam in self.cameras.items():
-            self.logger.info(f"{name}: {cam.width}x{cam.height} orient={cam.orientation}")
+            self.logger.info("%s: %sx%s orient=%s", name, cam.width, cam.height, cam.orientation)
 
     def release_all(self):
         for cam in self.cameras.values():
@@ -113,9 +184,12 @@ class NoWebcamPlugin(WebcamPlugin):  # Inherit for API similarity; override init
 
 # Helper to mirror webcam plugin singleton style (optional)
 _no_webcam_plugin_instance: Optional[NoWebcamPlugin] = None
+_no_webcam_plugin_lock = threading.Lock()
 
 def get_no_webcam_plugin() -> NoWebcamPlugin:
     global _no_webcam_plugin_instance
     if _no_webcam_plugin_instance is None:
-        _no_webcam_plugin_instance = NoWebcamPlugin()
-    return _no_webcam_plugin_instance
\ No newline at end of file
+        with _no_webcam_plugin_lock:
+            if _no_webcam_plugin_instance is None:
+                _no_webcam_plugin_instance = NoWebcamPlugin()
+    return _no_webcam_plugin_instance
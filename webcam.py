@@ -1,10 +1,161 @@
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+import sys
+import threading
+import time
+import weakref
+from functools import partial
+from typing import List, Optional, Tuple
 from utils.logger_util.logger import get_logger
 
+# Seconds the reader thread waits before retrying after a failed read
+READ_RETRY_DELAY = 0.05
+# Seconds release() waits for the reader thread to finish its current read
+READER_JOIN_TIMEOUT = 1.0
+# Seconds a threaded get_frame waits for the reader's first read after opening
+FIRST_FRAME_TIMEOUT = 2.0
+# A grab() slower than this waited on the camera, i.e. it returned a live frame
+# rather than one already queued in the driver buffer (those take well under 1 ms)
+LIVE_GRAB_THRESHOLD = 0.005
+# Device frames get_gpu_frame cycles through before overwriting one a caller may hold
+GPU_RING_SIZE = 3
+
+# Properties mirrored in Webcam's cache; setting one of them re-reads the cache
+_CACHED_PROPS = (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT, cv2.CAP_PROP_FPS)
+
+# cv2.rotate codes for the orientations that transpose the frame. OpenCV copies
+# these tile by tile with SIMD loads, several times faster than NumPy
+# materializing the strided np.rot90 view on large frames
+_TRANSPOSE_CODES = {90.0: cv2.ROTATE_90_CLOCKWISE, 270.0: cv2.ROTATE_90_COUNTERCLOCKWISE}
+
+
+def _identity(frame: np.ndarray) -> np.ndarray:
+    return frame
+
+
+def _flip_view(frame: np.ndarray) -> np.ndarray:
+    return frame[::-1, ::-1]
+
+
+# Clockwise rotation per orientation, as zero-copy strided views
+# (np.rot90 turns counter-clockwise for positive k)
+_ROTATE_VIEW = {
+    0.0: _identity,
+    90.0: partial(np.rot90, k=-1),
+    180.0: _flip_view,
+    270.0: partial(np.rot90, k=1),
+}
+# Same rotations materialized as C-contiguous arrays; all but the identity take
+# dst= to write into an existing buffer. cv2.flip reverses both axes in one
+# vectorized pass, ~20x faster than NumPy copying the reversed view
+_ROTATE_CONTIGUOUS = {
+    0.0: _identity,
+    90.0: partial(cv2.rotate, rotateCode=_TRANSPOSE_CODES[90.0]),
+    180.0: partial(cv2.flip, flipCode=-1),
+    270.0: partial(cv2.rotate, rotateCode=_TRANSPOSE_CODES[270.0]),
+}
+
+
+def _cuda_available() -> bool:
+    """True if this OpenCV build has CUDA support and sees at least one device."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _default_backend() -> int:
+    """Native capture API for this platform, so OpenCV skips FFmpeg format probing."""
+    if sys.platform.startswith('linux'):
+        return cv2.CAP_V4L2
+    if sys.platform == 'win32':
+        return cv2.CAP_DSHOW
+    if sys.platform == 'darwin':
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+class _LatestFrame:
+    """Single slot holding the newest frame published by a reader thread."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Notified whenever a new frame is published (or the reader stops)
+        self.updated = threading.Condition(self.lock)
+        self.frame: Optional[np.ndarray] = None
+        self.seq = 0  # Number of frames published so far
+        self.attempted = False  # Set once the reader's first read finished, success or not
+
+
+class _CaptureStats:
+    """
+    Capture counters, kept as plain ints (reads may be slightly stale).
+    
+    grabbed/retrieve counters are updated under the capture lock. dropped is too
+    in synchronous mode, but in threaded mode consumers update it in
+    _read_raw_frame under the latest-frame lock instead, not the capture lock.
+    """
+    def __init__(self):
+        self.grabbed = 0  # Successful grab() calls
+        self.dropped = 0  # Frames grabbed/published but never returned to a caller
+        self.retrieve_ns = 0  # Total time spent decoding in retrieve()
+        self.retrieves = 0
+        self.last_frame_ns: Optional[int] = None  # perf_counter_ns() of the newest decoded frame
+    
+    def retrieve(self, cap: cv2.VideoCapture, out: Optional[np.ndarray] = None):
+        """cap.retrieve(), timed into the counters."""
+        start = time.perf_counter_ns()
+        ret, frame = cap.retrieve(out) if out is not None else cap.retrieve()
+        end = time.perf_counter_ns()
+        self.retrieve_ns += end - start
+        self.retrieves += 1
+        if ret:
+            self.last_frame_ns = end
+        return ret, frame
+
+
+class _GpuStaging:
+    """Page-locked host frame and a ring of device frames for Webcam.get_gpu_frame."""
+    def __init__(self, height: int, width: int, ring_size: int):
+        self.host = np.empty((height, width, 3), dtype=np.uint8)
+        # Pinned memory lets uploads DMA straight from this buffer, asynchronously
+        cv2.cuda.registerPageLocked(self.host)
+        self.ring = [cv2.cuda.GpuMat(height, width, cv2.CV_8UC3) for _ in range(ring_size)]
+        self.next = 0
+        # Recorded after each upload; the host buffer is reused only once it fires
+        self.uploaded = cv2.cuda.Event()
+        self._unpin = weakref.finalize(self, _GpuStaging._release_host, self.host, self.uploaded)
+    
+    @staticmethod
+    def _release_host(host: np.ndarray, uploaded: "cv2.cuda.Event"):
+        try:
+            uploaded.waitForCompletion()
+            cv2.cuda.unregisterPageLocked(host)
+        except Exception:
+            # At interpreter shutdown cv2 may already be torn down
+            pass
+    
+    def close(self):
+        self._unpin()
+
+
 class Webcam:
-    def __init__(self, device_id: int = 0, width: int = 640, height: int = 480, buffer_size: int = 1, name: str = "default_camera", orientation: float = 0.0):
+    def __init__(
+        self,
+        device_id: int = 0,
+        width: int = 640,
+        height: int = 480,
+        buffer_size: int = 1,
+        name: str = "default_camera",
+        orientation: float = 0.0,
+        threaded: bool = True,
+        drop_stale: bool = True,
+        max_grab: Optional[int] = None,
+        pixel_format: Optional[str] = "MJPG",
+        fps: Optional[float] = None,
+        backend: Optional[int] = None,
+        gpu: bool = False,
+        cuda_stream: Optional["cv2.cuda.Stream"] = None,
+    ):
         """
         Initialize webcam with configurable properties.
         
@@ -15,6 +166,21 @@ class Webcam:
             buffer_size: Camera buffer size (1 for minimal latency)
             name: Human-readable name for the camera device
             orientation: Rotation to apply to frames (deg). Allowed: 0, 90, 180, 270.
+            threaded: Read frames on a background thread so get_frame returns the
+                latest frame without waiting for the camera
+            drop_stale: Without a reader thread, skip frames queued in the driver
+                buffer and decode only the newest one
+            max_grab: Most frames grabbed per get_frame when dropping stale frames
+                (defaults to buffer_size + 1: the queued frames plus a live one)
+            pixel_format: FOURCC requested from the driver. MJPG keeps USB bandwidth
+                low and is decoded by libjpeg-turbo; None keeps the driver default
+            fps: Frame rate requested from the driver (None keeps the driver default)
+            backend: OpenCV capture API (cv2.CAP_*); None picks the platform's native
+                one (V4L2, DirectShow, AVFoundation)
+            gpu: Enable get_gpu_frame(), which stages frames in page-locked memory
+                and uploads them to a CUDA device (needs an OpenCV CUDA build)
+            cuda_stream: CUDA stream the uploads are queued on (None creates one
+                per camera)
         """
         self.logger = get_logger("Webcam")
         self.device_id = device_id
@@ -23,6 +189,18 @@ class Webcam:
         self.raw_height = height
         self.buffer_size = buffer_size
         self.name = name
+        self.threaded = threaded
+        self.drop_stale = drop_stale
+        self.max_grab = max_grab if max_grab is not None else (buffer_size or 1) + 1
+        self.pixel_format = pixel_format
+        self.fps = fps
+        self.backend = backend if backend is not None else _default_backend()
+        if gpu and not _cuda_available():
+            self.logger.warning(f"Camera '{name}': OpenCV has no usable CUDA device, GPU upload disabled")
+            gpu = False
+        self.gpu = gpu
+        self.cuda_stream = (cuda_stream if cuda_stream is not None else cv2.cuda.Stream()) if gpu else None
+        self._gpu_staging: Optional[_GpuStaging] = None  # Allocated on first get_gpu_frame
         self.cap = None
         self.is_opened = False
         
@@ -38,28 +216,65 @@ class Webcam:
             if ori == 360.0:
                 ori = 0.0
         self.orientation = ori
+        # Orientation is fixed from here on, so pick the rotations once instead
+        # of branching on it for every frame
+        self._rotate = _ROTATE_VIEW[ori]
+        self._rotate_contiguous = _ROTATE_CONTIGUOUS[ori]
         
         self._initialize_camera()
+        # Releases the device if this Webcam is collected without release(). The
+        # callback only holds the capture objects, never self, so it cannot
+        # resurrect the camera; it also runs at interpreter exit before modules
+        # are torn down
+        self._finalizer = weakref.finalize(
+            self, Webcam._safe_release, self.cap, self._cap_lock, self._stop, self._reader)
     
     def _initialize_camera(self) -> bool:
         """Initialize the camera with specified properties."""
+        # Serializes cap access between the reader thread and property calls
+        self._cap_lock = threading.Lock()
+        self._latest = _LatestFrame()
+        self._stats = _CaptureStats()
+        self._rot_out: Optional[np.ndarray] = None  # Reused by contiguous rotations
+        self._stop = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._last_seq = 0  # seq of the last frame handed out by get_frame
         try:
-            self.cap = cv2.VideoCapture(self.device_id)
+            self.cap = cv2.VideoCapture(self.device_id, self.backend)
             
             if not self.cap.isOpened():
                 raise RuntimeError(f"Failed to open camera with device ID: {self.device_id}")
             
+            # Order matters: FOURCC -> WIDTH -> HEIGHT -> FPS -> BUFFERSIZE. V4L2 picks
+            # the modes available for the requested size and rate from the active format
+            if self.pixel_format:
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.pixel_format))
+            
             # Set camera properties using RAW (unrotated) dimensions
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.raw_width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.raw_height)
+            if self.fps:
+                self.cap.set(cv2.CAP_PROP_FPS, self.fps)
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
             
-            # Verify actual raw resolution
-            actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            actual_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            # Verify actual raw resolution and format; resolution/fps stay cached
+            # so info queries don't go back to the driver
+            self._refresh_cached_properties()
+            actual_format = self._decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC))
             
-            self.logger.info(f"Camera '{self.name}' initialized (raw): {actual_width}x{actual_height} (device_id: {self.device_id}, orientation: {int(self.orientation)}°)")
+            self.logger.info(f"Camera '{self.name}' initialized (raw): {self._cached_width}x{self._cached_height}@{self._cached_fps:g} {actual_format} via {self.cap.getBackendName()} (device_id: {self.device_id}, orientation: {int(self.orientation)}°)")
             self.is_opened = True
+            
+            if self.threaded:
+                # The loop only gets the objects it needs, so the thread never keeps self alive
+                self._reader = threading.Thread(
+                    target=Webcam._reader_loop,
+                    args=(self.cap, self._cap_lock, self._latest, self._stats, self._stop,
+                          self.logger, self.name),
+                    name=f"webcam-reader-{self.name}",
+                    daemon=True,
+                )
+                self._reader.start()
             return True
             
         except Exception as e:
@@ -67,39 +282,301 @@ class Webcam:
             self.is_opened = False
             return False
     
-    def _apply_orientation(self, frame: np.ndarray) -> np.ndarray:
-        """Rotate frame according to configured orientation (clockwise degrees)."""
+    def _refresh_cached_properties(self):
+        """Read the negotiated raw resolution and frame rate back from the driver."""
+        self._cached_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self._cached_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._cached_fps = self.cap.get(cv2.CAP_PROP_FPS)
+        # Rotation target sized for the new resolution, so contiguous frames don't
+        # allocate per call (OpenCV writes into dst whenever shape and type match)
+        if self.orientation in (90.0, 270.0):
+            self._rot_out = np.empty((self._cached_width, self._cached_height, 3), dtype=np.uint8)
+        elif self.orientation == 180.0:
+            self._rot_out = np.empty((self._cached_height, self._cached_width, 3), dtype=np.uint8)
+    
+    @staticmethod
+    def _decode_fourcc(value: float) -> str:
+        """Turn a CAP_PROP_FOURCC value back into its four-character code."""
+        code = int(value)
+        return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00") or "unknown"
+    
+    @staticmethod
+    def _reader_loop(cap: cv2.VideoCapture, cap_lock: threading.Lock, latest: _LatestFrame,
+                     stats: _CaptureStats, stop: threading.Event, logger, name: str):
+        """Continuously read frames and publish the newest one until stop is set."""
+        failing = False
+        while not stop.is_set():
+            with cap_lock:
+                # grab() + retrieve() is what read() does, split so decode time is counted
+                ret, frame = False, None
+                if cap.grab():
+                    stats.grabbed += 1
+                    ret, frame = stats.retrieve(cap)
+            # Each read allocates a fresh array, so a published frame is never
+            # overwritten while a consumer still holds it (no double-buffer aliasing).
+            # Every consumer shares it, so make in-place drawing fail instead of
+            # corrupting what the others see
+            if ret:
+                frame.flags.writeable = False
+            with latest.updated:
+                latest.frame = frame if ret else None
+                if ret:
+                    latest.seq += 1
+                if ret or not latest.attempted:
+                    # The first attempt also wakes get_frame callers waiting on it
+                    latest.attempted = True
+                    latest.updated.notify_all()
+            if not ret:
+                if not failing:
+                    logger.error(f"Failed to capture frame from camera '{name}'")
+                failing = True
+                # Back off instead of spinning on a device that stopped delivering
+                stop.wait(READ_RETRY_DELAY)
+            else:
+                failing = False
+        
+        # Wake consumers blocked in get_frame(wait=True) so they see the shutdown
+        with latest.updated:
+            latest.updated.notify_all()
+    
+    def _apply_orientation(self, frame: np.ndarray, contiguous: bool = False,
+                           copy: bool = False) -> np.ndarray:
+        """
+        Rotate frame according to configured orientation (clockwise degrees).
+        
+        Rotations only change strides, so the result is a view sharing memory
+        with ``frame``; no pixels are copied unless ``contiguous`` is requested.
+        Contiguous rotations are written into the camera's reusable buffer
+        unless ``copy`` asks for a newly allocated array.
+        """
         if frame is None:
             return frame
-        if self.orientation == 0.0:
-            return frame
-        if self.orientation == 90.0:
-            return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        if self.orientation == 180.0:
-            return cv2.rotate(frame, cv2.ROTATE_180)
-        if self.orientation == 270.0:
-            return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        # Fallback no-op
-        return frame
+        if not contiguous:
+            return self._rotate(frame)
+        if copy and self.orientation == 0.0:
+            # The identity rotation returns the (possibly shared) frame itself
+            return frame.copy()
+        if copy or self._rot_out is None:
+            return self._rotate_contiguous(frame)
+        return self._rotate_contiguous(frame, dst=self._rot_out)
+    
+    def _grab_latest(self) -> bool:
+        """
+        Grab (without decoding) until the newest frame is reached.
+        
+        Queued frames grab almost instantly; once a grab has to wait for the
+        camera the frame is live and flushing stops. Only that last grab is
+        decoded by the following retrieve(). Without drop_stale this is a
+        single grab().
+        """
+        stats = self._stats
+        grabs = 0
+        for _ in range(self.max_grab if self.drop_stale else 1):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                break
+            grabs += 1
+            if time.perf_counter() - start > LIVE_GRAB_THRESHOLD:
+                break
+        stats.grabbed += grabs
+        if grabs > 1:
+            stats.dropped += grabs - 1
+        return grabs > 0
     
-    def get_frame(self) -> Optional[np.ndarray]:
+    def get_frame(self, contiguous: bool = False, wait: bool = False,
+                  timeout: Optional[float] = None, copy: bool = False) -> Optional[np.ndarray]:
         """
         Capture and return a frame from the webcam, rotated per orientation.
         
+        In threaded mode this returns the most recent frame delivered by the
+        reader thread without blocking (the first call after opening waits for
+        the first frame); the same frame is returned again until a newer one
+        arrives. It is shared by every caller and read-only, so copy it (or use
+        ``contiguous=True, copy=True``) before drawing on it.
+        
+        Rotated frames are zero-copy strided views of the captured frame. OpenCV
+        and NumPy accept them as input; pass ``contiguous=True`` when a consumer
+        needs C-contiguous memory (e.g. buffer protocol or in-place cv2 drawing).
+        A rotated contiguous frame lives in a buffer the camera reuses, so the
+        next call overwrites it; pass ``copy=True`` to keep it.
+        
+        Args:
+            contiguous: Return a C-contiguous array instead of a strided view
+            wait: In threaded mode, block until a frame newer than the last one
+                returned arrives
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            copy: With ``contiguous``, return a newly allocated, writable array
+                instead of the reused rotation buffer or the shared frame
+        
+        Returns:
+            np.ndarray: BGR image frame (after orientation), or None if capture failed,
+                no frame has arrived yet, or ``wait`` timed out without a new frame
+        """
+        if not self.is_opened or self.cap is None:
+            return None
+        
+        frame = self._read_raw_frame(wait, timeout)
+        
+        # Apply orientation so downstream sees correctly oriented frames
+        frame = self._apply_orientation(frame, contiguous, copy)
+        return frame
+    
+    def get_frame_into(self, out: np.ndarray, wait: bool = False,
+                       timeout: Optional[float] = None) -> bool:
+        """
+        Capture the next frame into a caller-owned buffer instead of a new array.
+        
+        Without a reader thread or rotation the driver decodes straight into
+        ``out`` (no allocation, no copy); otherwise the frame is rotated/copied
+        into it in a single pass.
+        
+        Args:
+            out: C-contiguous uint8 array shaped like get_frame()'s result,
+                i.e. (height, width, 3) after orientation (see preallocate_ring)
+            wait: In threaded mode, block until a new frame arrives
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
         Returns:
-            np.ndarray: BGR image frame (after orientation), or None if capture failed
+            bool: True if ``out`` now holds a new frame; False if capture failed or
+                the frame doesn't match ``out``'s shape (e.g. right after set_resolution)
         """
+        width, height = self.get_resolution()
+        if out.shape != (height, width, 3) or out.dtype != np.uint8:
+            raise ValueError(f"out must be a ({height}, {width}, 3) uint8 array, got {out.shape} {out.dtype}")
         if not self.is_opened or self.cap is None:
+            return False
+        
+        if not self.threaded and self.orientation == 0.0:
+            with self._cap_lock:
+                # retrieve() only reuses out when it matches the decoded frame
+                ret, frame = self._stats.retrieve(self.cap, out) if self._grab_latest() else (False, None)
+            if not ret:
+                self.logger.error(f"Failed to capture frame from camera '{self.name}'")
+                return False
+            return frame is out or self._reject_frame(frame, out)
+        
+        frame = self._read_raw_frame(wait, timeout)
+        if frame is None:
+            return False
+        if self.orientation == 0.0:
+            if frame.shape != out.shape:
+                return self._reject_frame(frame, out)
+            np.copyto(out, frame)
+            return True
+        # OpenCV silently allocates a new array when dst doesn't fit the result
+        rotated = self._rotate_contiguous(frame, dst=out)
+        return rotated is out or self._reject_frame(rotated, out)
+    
+    def _reject_frame(self, frame: np.ndarray, out: np.ndarray) -> bool:
+        """Log a frame that doesn't fit ``out`` (e.g. decoded before a resolution change)."""
+        self.logger.warning(f"Frame from camera '{self.name}' is {frame.shape}, expected {out.shape}; buffer left unchanged")
+        return False
+    
+    def get_gpu_frame(self, wait: bool = False,
+                      timeout: Optional[float] = None) -> Optional["cv2.cuda.GpuMat"]:
+        """
+        Capture the next oriented frame and upload it to the GPU (requires gpu=True).
+        
+        The frame is captured into a page-locked host buffer (see get_frame_into)
+        and uploaded asynchronously on ``cuda_stream``; queue dependent work on
+        that stream, or synchronize it, before reading the result. Returned
+        GpuMats come from a ring of GPU_RING_SIZE buffers and are overwritten
+        after that many calls.
+        
+        Args:
+            wait: In threaded mode, block until a new frame arrives
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            cv2.cuda.GpuMat: Device frame, or None if capture failed
+        """
+        if not self.gpu:
+            raise RuntimeError(f"Camera '{self.name}' was not opened with gpu=True")
+        width, height = self.get_resolution()
+        staging = self._gpu_staging
+        if staging is None or staging.host.shape[:2] != (height, width):
+            # First call, or the resolution changed since the buffers were sized
+            if staging is not None:
+                staging.close()
+            staging = self._gpu_staging = _GpuStaging(height, width, GPU_RING_SIZE)
+        
+        # The previous upload may still be reading the host buffer
+        staging.uploaded.waitForCompletion()
+        if not self.get_frame_into(staging.host, wait, timeout):
             return None
+        gpu_frame = staging.ring[staging.next]
+        staging.next = (staging.next + 1) % len(staging.ring)
+        gpu_frame.upload(staging.host, self.cuda_stream)
+        staging.uploaded.record(self.cuda_stream)
+        return gpu_frame
+    
+    def grab(self) -> bool:
+        """
+        Grab the newest frame without decoding it; decode it with retrieve().
         
-        ret, frame = self.cap.read()
+        Splitting the two lets callers grab several cameras back to back (so
+        their frames are close in time) before paying for any decode. In
+        threaded mode the reader thread grabs, so this only reports whether
+        the camera is open.
+        """
+        if not self.is_opened or self.cap is None:
+            return False
+        if self.threaded:
+            return True
+        with self._cap_lock:
+            grabbed = self._grab_latest()
+        if not grabbed:
+            self.logger.error(f"Failed to grab frame from camera '{self.name}'")
+        return grabbed
+    
+    def retrieve(self, contiguous: bool = False) -> Optional[np.ndarray]:
+        """
+        Decode the frame from the last grab(), rotated per orientation.
         
+        In threaded mode this returns the reader thread's latest frame, like get_frame().
+        """
+        if not self.is_opened or self.cap is None:
+            return None
+        if self.threaded:
+            return self.get_frame(contiguous)
+        with self._cap_lock:
+            ret, frame = self._stats.retrieve(self.cap)
         if not ret:
             self.logger.error(f"Failed to capture frame from camera '{self.name}'")
             return None
+        return self._apply_orientation(frame, contiguous)
+    
+    def preallocate_ring(self, n: int = 2) -> List[np.ndarray]:
+        """Allocate ``n`` buffers for get_frame_into that callers can rotate through."""
+        width, height = self.get_resolution()
+        return [np.empty((height, width, 3), dtype=np.uint8) for _ in range(n)]
+    
+    def _read_raw_frame(self, wait: bool = False, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Newest unrotated frame: from the reader thread, or read synchronously."""
+        if self.threaded:
+            latest = self._latest
+            with latest.updated:
+                if not latest.attempted and not wait:
+                    # Just opened: wait for the reader's first read instead of returning None.
+                    # Once it has tried, a camera that delivers nothing never blocks again.
+                    latest.updated.wait_for(lambda: latest.attempted or self._stop.is_set(),
+                                            FIRST_FRAME_TIMEOUT if timeout is None else timeout)
+                if wait and not latest.updated.wait_for(
+                        lambda: latest.seq != self._last_seq or self._stop.is_set(), timeout):
+                    # Timed out: nothing new arrived, and the last frame stays unconsumed
+                    return None
+                # Frames published since the last call but never returned were dropped
+                if latest.seq > self._last_seq + 1:
+                    self._stats.dropped += latest.seq - self._last_seq - 1
+                self._last_seq = latest.seq
+                return latest.frame
         
-        # Apply orientation so downstream sees correctly oriented frames
-        frame = self._apply_orientation(frame)
+        with self._cap_lock:
+            ret, frame = self._stats.retrieve(self.cap) if self._grab_latest() else (False, None)
+        
+        if not ret:
+            self.logger.error(f"Failed to capture frame from camera '{self.name}'")
+            return None
         return frame
     
     def set_property(self, prop_id: int, value: float) -> bool:
@@ -116,7 +593,11 @@ class Webcam:
         if not self.is_opened or self.cap is None:
             return False
         
-        return self.cap.set(prop_id, value)
+        with self._cap_lock:
+            success = self.cap.set(prop_id, value)
+            if prop_id in _CACHED_PROPS:
+                self._refresh_cached_properties()
+        return success
     
     def get_property(self, prop_id: int) -> float:
         """
@@ -131,7 +612,8 @@ class Webcam:
         if not self.is_opened or self.cap is None:
             return -1
         
-        return self.cap.get(prop_id)
+        with self._cap_lock:
+            return self.cap.get(prop_id)
     
     def get_resolution(self) -> Tuple[int, int]:
         """
@@ -146,8 +628,8 @@ class Webcam:
                 return (self.raw_height, self.raw_width)
             return (self.raw_width, self.raw_height)
         
-        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        # Cached at open and refreshed whenever resolution/fps are set
+        width, height = self._cached_width, self._cached_height
         if self.orientation in (90.0, 270.0):
             return (height, width)
         return (width, height)
@@ -166,8 +648,10 @@ class Webcam:
         if not self.is_opened or self.cap is None:
             return False
         
-        success_width = self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        success_height = self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        with self._cap_lock:
+            success_width = self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            success_height = self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self._refresh_cached_properties()
         
         if success_width and success_height:
             self.raw_width = width
@@ -194,18 +678,62 @@ class Webcam:
             "orientation": int(self.orientation),
             "buffer_size": self.buffer_size,
             "is_opened": self.is_opened,
-            "fps": self.get_property(cv2.CAP_PROP_FPS) if self.is_opened else -1
+            "fps": self._cached_fps if self.is_opened else -1
+        }
+    
+    @staticmethod
+    def _safe_release(cap: Optional[cv2.VideoCapture], cap_lock: threading.Lock,
+                      stop: threading.Event, reader: Optional[threading.Thread]) -> bool:
+        """Stop the reader thread and release the capture; True if a capture was released."""
+        try:
+            if reader is not None:
+                stop.set()
+                reader.join(timeout=READER_JOIN_TIMEOUT)
+            if cap is None:
+                return False
+            with cap_lock:
+                cap.release()
+            return True
+        except Exception:
+            # At interpreter shutdown cv2 may already be torn down
+            return False
+    
+    @property
+    def stats(self) -> dict:
+        """
+        Snapshot of the capture counters.
+        
+        Returns:
+            dict: grabbed, dropped (skipped stale frames), retrieves, retrieve_ns
+                (total decode time), retrieve_ms_avg, and last_frame_age_ms (None
+                before the first frame)
+        """
+        stats = self._stats
+        last = stats.last_frame_ns
+        return {
+            "grabbed": stats.grabbed,
+            "dropped": stats.dropped,
+            "retrieves": stats.retrieves,
+            "retrieve_ns": stats.retrieve_ns,
+            "retrieve_ms_avg": stats.retrieve_ns / stats.retrieves / 1e6 if stats.retrieves else 0.0,
+            "last_frame_age_ms": (time.perf_counter_ns() - last) / 1e6 if last is not None else None,
         }
     
     def release(self):
-        """Release the camera resource."""
-        if self.cap is not None:
-            self.cap.release()
-            self.is_opened = False
+        """Release the camera resource. Safe to call more than once."""
+        # A finalizer runs at most once, so later calls (and the GC) are no-ops
+        if self._finalizer():
             self.logger.info(f"Camera '{self.name}' released")
+        if self._gpu_staging is not None:
+            self._gpu_staging.close()
+            self._gpu_staging = None
+        self._reader = None
+        self.is_opened = False
+    
+    def __enter__(self) -> "Webcam":
+        return self
     
-    def __del__(self):
-        """Destructor to ensure camera is released."""
+    def __exit__(self, exc_type, exc_value, traceback):
         self.release()
     
     @property
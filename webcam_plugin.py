@@ -1,4 +1,10 @@
-from typing import Dict, Optional, List
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, List, Tuple
+import numpy as np
 from .webcam import Webcam
 from .camera_identifier import create_camera_identifier
 
@@ -7,10 +13,60 @@ from managers.config_manager.config_manager import ConfigManager
 from utils.logger_util.logger import get_logger
 
 
-class WebcamPlugin:
+@dataclass(frozen=True, slots=True)
+class DeviceCfg:
+    """One webcam_plugin.devices entry, validated before any camera is opened."""
+    name: str
+    device_id: int
+    width: int = 640
+    height: int = 480
+    buffer_size: int = 1
+    orientation: float = 0.0
+    fps: Optional[float] = None
+    pixel_format: Optional[str] = "MJPG"  # None keeps the driver default
+    
+    @classmethod
+    def from_config(cls, device, index: int) -> "DeviceCfg":
+        """
+        Read and coerce a generated config entry; missing or null fields take the defaults.
+        
+        Raises:
+            ValueError: device_id is missing, or a field has the wrong type
+        """
+        defaults = {f.name: f.default for f in fields(cls)}
+        
+        def setting(key: str):
+            value = getattr(device, key, None)
+            return defaults[key] if value is None else value
+        
+        name = str(getattr(device, 'name', None) or f"camera_{index}")
+        device_id = getattr(device, 'device_id', None)
+        if device_id is None:
+            raise ValueError(f"'{name}': missing device_id in config")
+        fps = setting('fps')
+        try:
+            return cls(
+                name=name,
+                device_id=int(device_id),
+                width=int(setting('width')),
+                height=int(setting('height')),
+                buffer_size=int(setting('buffer_size')),
+                orientation=float(setting('orientation')),
+                fps=float(fps) if fps is not None else None,
+                # An explicit null is meaningful here, so only a missing key gets the default
+                pixel_format=getattr(device, 'pixel_format', defaults['pixel_format']),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"'{name}': invalid device config: {e}") from e
+
+
+class WebcamPlugin(AbstractContextManager):
     """
     WebcamPlugin provides managed access to multiple webcam devices.
     Integrates with ConfigManager to load camera configurations.
+    
+    Use it as a context manager (or call release_all()) to release the cameras
+    deterministically; cameras left open are released by their own finalizers.
     """
     
     def __init__(self):
@@ -19,6 +75,8 @@ class WebcamPlugin:
         self.config_manager = ConfigManager()
         self.camera_identifier = create_camera_identifier()
         self.cameras: Dict[str, Webcam] = {}
+        self._by_name: Dict[str, Webcam] = {}  # camera.name -> camera, for O(1) name lookups
+        self._read_pool: Optional[ThreadPoolExecutor] = None  # Created on first read_all_frames
         # Removed hardware signature based tracking
         self._load_cameras_from_config()
     
@@ -28,58 +86,73 @@ class WebcamPlugin:
             # Log available devices (ids only) for operator awareness
             try:
                 available_devices = self.camera_identifier.get_available_video_devices()
-                self.logger.info(f"Found {len(available_devices)} video devices: {available_devices}")
+                self.logger.info("Found %d video devices: %s", len(available_devices), available_devices)
             except Exception as e:
-                self.logger.debug(f"Device discovery skipped: {e}")
+                self.logger.debug("Device discovery skipped: %s", e)
             
             # Access webcam_plugin configuration (generated typed keys)
             webcam_config = self.config_manager.config.webcam_plugin
             devices_config = (webcam_config.devices or []) if webcam_config else []
             
-            loaded_count = 0
-            for device in devices_config:
-                name = getattr(device, 'name', None) or f"camera_{loaded_count}"
-                device_id = getattr(device, 'device_id', None)
-                if device_id is None:
-                    self.logger.warning(f"Skipping '{name}': missing device_id in config")
-                    continue
+            # Validate every entry up front so config errors surface before any camera opens
+            device_cfgs: List[DeviceCfg] = []
+            for index, device in enumerate(devices_config):
                 try:
-                    camera = Webcam(
-                        device_id=device_id,
-                        width=getattr(device, 'width', None),
-                        height=getattr(device, 'height', None),
-                        buffer_size=getattr(device, 'buffer_size', None),
-                        name=name,
-                        orientation=getattr(device, 'orientation', 0.0),
-                    )
-                    self.cameras[name] = camera
-                    loaded_count += 1
-                    self.logger.info(f"Loaded camera '{name}' (device_id={device_id})")
-                except Exception as cam_err:
-                    self.logger.error(f"Failed to create camera '{name}': {cam_err}")
+                    device_cfgs.append(DeviceCfg.from_config(device, index))
+                except ValueError as e:
+                    self.logger.warning("Skipping %s", e)
+            
+            # Opening a capture can block for seconds while the backend probes the
+            # device, so open every configured camera concurrently
+            if device_cfgs:
+                with ThreadPoolExecutor(max_workers=min(8, len(device_cfgs))) as executor:
+                    results = list(executor.map(self._make_camera, device_cfgs))
+                # Register on this thread, in config order
+                for result in results:
+                    if result is not None:
+                        name, camera = result
+                        self.cameras[name] = camera
+                        self._by_name[camera.name] = camera
 
-            self.logger.info(f"Successfully loaded {len(self.cameras)} cameras")
+            self.logger.info("Successfully loaded %d cameras", len(self.cameras))
                 
         except Exception as e:
-            self.logger.error(f"Error loading camera configuration: {e}")
+            self.logger.error("Error loading camera configuration: %s", e)
             # Fallback: create a default camera
             self.cameras['default'] = Webcam(name="default_camera")
+            self._by_name[self.cameras['default'].name] = self.cameras['default']
+
+    def _make_camera(self, cfg: DeviceCfg) -> Optional[Tuple[str, Webcam]]:
+        """Open the camera for one device config entry; returns None if it fails."""
+        try:
+            camera = Webcam(
+                device_id=cfg.device_id,
+                width=cfg.width,
+                height=cfg.height,
+                buffer_size=cfg.buffer_size,
+                name=cfg.name,
+                orientation=cfg.orientation,
+                pixel_format=cfg.pixel_format,
+                fps=cfg.fps,
+            )
+            self.logger.info("Loaded camera '%s' (device_id=%s)", cfg.name, cfg.device_id)
+            return cfg.name, camera
+        except Exception as cam_err:
+            self.logger.error("Failed to create camera '%s': %s", cfg.name, cam_err)
+            return None
 
     def get_camera(self, camera_id: str) -> Optional[Webcam]:
         return self.cameras.get(camera_id)
     
     def get_camera_by_name(self, name: str) -> Optional[Webcam]:
-        for camera in self.cameras.values():
-            if camera.name == name:
-                return camera
-        return None
+        return self._by_name.get(name)
 
     def get_all_cameras(self) -> Dict[str, Webcam]:
         """Return all loaded cameras."""
         return self.cameras
     
     def get_camera_names(self) -> List[str]:
-        return [camera.name for camera in self.cameras.values()]
+        return list(self._by_name)
 
     def get_active_cameras(self) -> Dict[str, Webcam]:
         return {
@@ -94,37 +167,95 @@ class WebcamPlugin:
             return camera.get_device_info()
         return None
     
+    def read_all_frames(self, contiguous: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Read one oriented frame from every active camera, keyed by camera id.
+        
+        Cameras without a reader thread are all grabbed first and decoded
+        afterwards, each phase on a small thread pool so the driver waits
+        overlap: a tick costs about the slowest camera rather than the sum of
+        all of them. Threaded cameras contribute their latest frame. Cameras
+        that fail to deliver a frame are left out. Rotated ``contiguous`` frames
+        live in each camera's reused buffer (see Webcam.get_frame).
+        """
+        active = self.get_active_cameras()
+        synchronous = {cam_id: camera for cam_id, camera in active.items() if not camera.threaded}
+        decoded: Dict[str, Optional[np.ndarray]] = {}
+        if synchronous:
+            if self._read_pool is None:
+                self._read_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="webcam-read")
+            # grab() and retrieve() release the GIL while they wait on the driver
+            cameras = list(synchronous.values())
+            grabbed = list(self._read_pool.map(Webcam.grab, cameras))
+            decoded = dict(zip(synchronous, self._read_pool.map(
+                lambda camera, ok: camera.retrieve(contiguous) if ok else None, cameras, grabbed)))
+        
+        frames: Dict[str, np.ndarray] = {}
+        for cam_id, camera in active.items():
+            frame = decoded[cam_id] if cam_id in decoded else camera.get_frame(contiguous)
+            if frame is not None:
+                frames[cam_id] = frame
+        return frames
+    
+    def get_stats(self) -> dict:
+        """
+        Capture counters per camera id (see Webcam.stats) and summed over all cameras.
+        
+        Returns:
+            dict: {"cameras": {cam_id: stats}, "total": stats}; the total's
+                last_frame_age_ms is the oldest camera's
+        """
+        cameras = {cam_id: camera.stats for cam_id, camera in self.cameras.items()}
+        total = {key: sum(stats[key] for stats in cameras.values())
+                 for key in ("grabbed", "dropped", "retrieves", "retrieve_ns")}
+        total["retrieve_ms_avg"] = total["retrieve_ns"] / total["retrieves"] / 1e6 if total["retrieves"] else 0.0
+        ages = [stats["last_frame_age_ms"] for stats in cameras.values() if stats["last_frame_age_ms"] is not None]
+        total["last_frame_age_ms"] = max(ages) if ages else None
+        return {"cameras": cameras, "total": total}
+    
     def list_cameras(self) -> None:
         """Log a summary of all configured cameras."""
-        self.logger.info(f"\nWebcamPlugin - Available Cameras ({len(self.cameras)}):")
+        # Skip the per-camera info queries entirely when nothing would be logged
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("\nWebcamPlugin - Available Cameras (%d):", len(self.cameras))
         self.logger.info("-" * 50)
         
         for cam_id, camera in self.cameras.items():
             info = camera.get_device_info()
-            self.logger.info(f"{cam_id}: oriented={info['width']}x{info['height']} raw={info['raw_width']}x{info['raw_height']} ori={info['orientation']}° id={info['device_id']}")
+            self.logger.info("%s: oriented=%sx%s raw=%sx%s ori=%s° id=%s", cam_id, info['width'], info['height'],
+                             info['raw_width'], info['raw_height'], info['orientation'], info['device_id'])
     
     def release_all(self):
         """Release all camera resources."""
         for camera in self.cameras.values():
             camera.release()
+        if self._read_pool is not None:
+            self._read_pool.shutdown(wait=False)
+            self._read_pool = None
+        # Stops the Linux udev monitor; discovery restarts it if needed again
+        self.camera_identifier.close()
         self.logger.info("All cameras released")
     
-    def __del__(self):
-        """Destructor to ensure all cameras are released."""
+    def __exit__(self, exc_type, exc_value, traceback):
         self.release_all()
 
 
 # Singleton instance for easy access
 _webcam_plugin_instance = None
+# Held while the singleton is built, so concurrent first calls don't each open every camera
+_webcam_plugin_lock = threading.Lock()
 
 def get_webcam_plugin() -> WebcamPlugin:
     """
-    Get the singleton WebcamPlugin instance.
+    Get the singleton WebcamPlugin instance. Safe to call from several threads.
     
     Returns:
         WebcamPlugin instance
     """
     global _webcam_plugin_instance
     if _webcam_plugin_instance is None:
-        _webcam_plugin_instance = WebcamPlugin()
-    return _webcam_plugin_instance
\ No newline at end of file
+        with _webcam_plugin_lock:
+            if _webcam_plugin_instance is None:
+                _webcam_plugin_instance = WebcamPlugin()
+    return _webcam_plugin_instance